@@ -13,6 +13,8 @@ if t.TYPE_CHECKING:
 
 
 class Column:
+    __slots__ = ("expression",)
+
     def __init__(self, expression: t.Optional[t.Union[ColumnOrLiteral, exp.Expression]]):
         if isinstance(expression, Column):
             expression = expression.expression  # type: ignore
@@ -14,10 +14,17 @@ from sqlglot.dataframe.sql.normalize import normalize
 from sqlglot.dataframe.sql.operations import Operation, operation
 from sqlglot.dataframe.sql.readwriter import DataFrameWriter
 from sqlglot.dataframe.sql.transforms import replace_id_value
-from sqlglot.dataframe.sql.util import get_tables_from_expression_with_join
+from sqlglot.dataframe.sql.util import (
+    balanced_reduce,
+    get_tables_from_expression_with_join,
+)
 from sqlglot.dataframe.sql.window import Window
-from sqlglot.helper import ensure_list, object_to_dict
+from sqlglot.helper import ensure_list
 from sqlglot.optimizer import optimize as optimize_func
+from sqlglot.optimizer.annotate_types import annotate_types
+from sqlglot.optimizer.optimizer import RULES
+from sqlglot.optimizer.qualify_columns import qualify_columns
+from sqlglot.optimizer.qualify_tables import qualify_tables
 
 if t.TYPE_CHECKING:
     from sqlglot.dataframe.sql._typing import (
@@ -40,8 +47,22 @@ JOIN_HINTS = {
     "SHUFFLE_REPLICATE_NL",
 }
 
+# The rules needed to know the column types of a cached select, used when `sql()` ran without them
+CACHE_SCHEMA_RULES = (qualify_tables, qualify_columns, annotate_types)
+
 
 class DataFrame:
+    __slots__ = (
+        "spark",
+        "expression",
+        "branch_id",
+        "sequence_id",
+        "last_op",
+        "pending_hints",
+        "output_expression_container",
+        "_outer_select_cache",
+    )
+
     def __init__(
         self,
         spark: SparkSession,
@@ -60,6 +81,7 @@ class DataFrame:
         self.last_op = last_op
         self.pending_hints = pending_hints or []
         self.output_expression_container = output_expression_container or exp.Select()
+        self._outer_select_cache: t.Optional[t.Tuple[exp.Expression, t.List[Column]]] = None
 
     def __getattr__(self, column_name: str) -> Column:
         return self[column_name]
@@ -95,11 +117,20 @@ class DataFrame:
 
     @property
     def pending_join_hints(self):
-        return [hint for hint in self.pending_hints if isinstance(hint, exp.JoinHint)]
+        return self._split_pending_hints()[0]
 
     @property
     def pending_partition_hints(self):
-        return [hint for hint in self.pending_hints if isinstance(hint, exp.Anonymous)]
+        return self._split_pending_hints()[1]
+
+    @property
+    def _outer_select_columns(self) -> t.List[Column]:
+        if self._outer_select_cache is None or self._outer_select_cache[0] is not self.expression:
+            self._outer_select_cache = (
+                self.expression,
+                self._get_outer_select_columns(self.expression),
+            )
+        return list(self._outer_select_cache[1])
 
     @property
     def columns(self) -> t.List[str]:
@@ -109,15 +140,40 @@ class DataFrame:
     def na(self) -> DataFrameNaFunctions:
         return DataFrameNaFunctions(self)
 
+    def _split_pending_hints(self) -> t.Tuple[t.List[exp.JoinHint], t.List[exp.Anonymous]]:
+        join_hints = []
+        partition_hints = []
+        for hint in self.pending_hints:
+            if isinstance(hint, exp.JoinHint):
+                join_hints.append(hint)
+            elif isinstance(hint, exp.Anonymous):
+                partition_hints.append(hint)
+        return join_hints, partition_hints
+
     def _replace_cte_names_with_hashes(self, expression: exp.Select):
+        """
+        Renames the CTEs of the expression, and every reference to them, in-place so the expression
+        must not be shared with a DataFrame.
+
+        CTE names can only be referenced by tables, table aliases and columns (either as the table
+        of a column or as the argument of a join hint) so only those nodes are checked.
+        """
         replacement_mapping = {}
         for cte in expression.ctes:
             old_name_id = cte.args["alias"].this
-            new_hashed_id = exp.to_identifier(
-                self._create_hash_from_expression(cte.this), quoted=old_name_id.args["quoted"]
+            replacement_mapping[old_name_id.name.lower()] = (
+                self._create_hash_from_expression(cte.this),
+                old_name_id.args["quoted"],
             )
-            replacement_mapping[old_name_id] = new_hashed_id
-            expression = expression.transform(replace_id_value, replacement_mapping)
+        if replacement_mapping:
+            for node in expression.find_all(exp.Table, exp.TableAlias, exp.Column):
+                for identifier in (node.this, node.args.get("table")):
+                    if not isinstance(identifier, exp.Identifier):
+                        continue
+                    replacement = replacement_mapping.get(identifier.name.lower())
+                    if replacement:
+                        identifier.set("this", replacement[0])
+                        identifier.set("quoted", replacement[1])
         return expression
 
     def _create_cte_from_expression(
@@ -128,8 +184,13 @@ class DataFrame:
         **kwargs,
     ) -> t.Tuple[exp.CTE, str]:
         name = self.spark._random_name
-        expression_to_cte = expression.copy()
-        expression_to_cte.set("with", None)
+        # Copy the body without its CTEs instead of copying them only to throw them away
+        args = expression.args
+        expression.args = {k: v for k, v in args.items() if k != "with"}
+        try:
+            expression_to_cte = expression.copy()
+        finally:
+            expression.args = args
         cte = exp.Select().with_(name, as_=expression_to_cte, **kwargs).ctes[0]
         cte.set("branch_id", branch_id or self.branch_id)
         cte.set("sequence_id", sequence_id or self.sequence_id)
@@ -144,7 +205,10 @@ class DataFrame:
         ...
 
     def _ensure_list_of_columns(self, cols):
-        return Column.ensure_cols(ensure_list(cols))
+        cols = ensure_list(cols)
+        if all(type(col) is Column for col in cols):
+            return cols
+        return Column.ensure_cols(cols)
 
     def _ensure_and_normalize_cols(self, cols):
         cols = self._ensure_list_of_columns(cols)
@@ -159,35 +223,44 @@ class DataFrame:
     def _convert_leaf_to_cte(self, sequence_id: t.Optional[str] = None) -> DataFrame:
         df = self._resolve_pending_hints()
         sequence_id = sequence_id or df.sequence_id
-        expression = df.expression.copy()
+        expression = df.expression
         cte_expression, cte_name = df._create_cte_from_expression(
             expression=expression, sequence_id=sequence_id
         )
         new_expression = df._add_ctes_to_expression(
-            exp.Select(), expression.ctes + [cte_expression]
+            exp.Select(), [cte.copy() for cte in expression.ctes] + [cte_expression]
         )
         sel_columns = df._get_outer_select_columns(cte_expression)
-        new_expression = new_expression.from_(cte_name).select(
-            *[x.alias_or_name for x in sel_columns]
+        new_expression = new_expression.from_(cte_name, copy=False).select(
+            *[x.alias_or_name for x in sel_columns], copy=False
         )
         return df.copy(expression=new_expression, sequence_id=sequence_id)
 
     def _resolve_pending_hints(self) -> DataFrame:
-        df = self.copy()
         if not self.pending_hints:
-            return df
-        expression = df.expression
-        hint_expression = expression.args.get("hint") or exp.Hint(expressions=[])
-        for hint in df.pending_partition_hints:
-            hint_expression.append("expressions", hint)
-            df.pending_hints.remove(hint)
-
+            return self.copy()
+        _, pending_partition_hints = self._split_pending_hints()
         join_aliases = {
             join_table.alias_or_name
-            for join_table in get_tables_from_expression_with_join(expression)
+            for join_table in get_tables_from_expression_with_join(self.expression)
         }
+        # Join hints can only be resolved once there is a join, until then nothing changes
+        if not pending_partition_hints and not join_aliases:
+            return self.copy()
+        # Resolving hints modifies both the expression and the hints, so neither can be shared
+        df = self.copy(
+            expression=self.expression.copy(),
+            pending_hints=[hint.copy() for hint in self.pending_hints],
+        )
+        expression = df.expression
+        hint_expression = expression.args.get("hint") or exp.Hint(expressions=[])
+        pending_join_hints, pending_partition_hints = df._split_pending_hints()
+        for partition_hint in pending_partition_hints:
+            hint_expression.append("expressions", partition_hint)
+            df.pending_hints.remove(partition_hint)
+
         if join_aliases:
-            for hint in df.pending_join_hints:
+            for hint in pending_join_hints:
                 for sequence_id_expression in hint.expressions:
                     sequence_id_or_name = sequence_id_expression.alias_or_name
                     sequence_ids_to_match = [sequence_id_or_name]
@@ -244,23 +317,26 @@ class DataFrame:
 
     @classmethod
     def _add_ctes_to_expression(cls, expression: exp.Select, ctes: t.List[exp.CTE]) -> exp.Select:
-        expression = expression.copy()
+        """
+        Adds the CTEs to the expression in-place, so callers must pass an expression they own.
+        """
         with_expression = expression.args.get("with")
         if with_expression:
-            existing_ctes = with_expression.expressions
-            existsing_cte_names = {x.alias_or_name for x in existing_ctes}
+            existing_cte_names = {x.alias_or_name for x in with_expression.expressions}
             for cte in ctes:
-                if cte.alias_or_name not in existsing_cte_names:
-                    existing_ctes.append(cte)
+                cte_name = cte.alias_or_name
+                if cte_name not in existing_cte_names:
+                    with_expression.append("expressions", cte)
+                    existing_cte_names.add(cte_name)
         else:
-            existing_ctes = ctes
-        expression.set("with", exp.With(expressions=existing_ctes))
+            expression.set("with", exp.With(expressions=ctes))
         return expression
 
     @classmethod
     def _get_outer_select_columns(cls, item: t.Union[exp.Expression, DataFrame]) -> t.List[Column]:
-        expression = item.expression if isinstance(item, DataFrame) else item
-        return [Column(x) for x in (expression.find(exp.Select) or exp.Select()).expressions]
+        if isinstance(item, DataFrame):
+            return item._outer_select_columns
+        return [Column(x) for x in (item.find(exp.Select) or exp.Select()).expressions]
 
     @classmethod
     def _create_hash_from_expression(cls, expression: exp.Select):
@@ -273,33 +349,55 @@ class DataFrame:
         select_expressions: t.List[
             t.Tuple[t.Union[t.Type[exp.Cache], OutputExpressionContainer], exp.Select]
         ] = []
+        main_select = self.expression.copy()
         main_select_ctes: t.List[exp.CTE] = []
-        for cte in self.expression.ctes:
+        for cte in main_select.ctes:
             cache_storage_level = cte.args.get("cache_storage_level")
             if cache_storage_level:
-                select_expression = cte.this.copy()
-                select_expression.set("with", exp.With(expressions=copy(main_select_ctes)))
+                select_expression = cte.this
+                select_expression.set(
+                    "with", exp.With(expressions=[main_cte.copy() for main_cte in main_select_ctes])
+                )
                 select_expression.set("cte_alias_name", cte.alias_or_name)
                 select_expression.set("cache_storage_level", cache_storage_level)
                 select_expressions.append((exp.Cache, select_expression))
             else:
                 main_select_ctes.append(cte)
-        main_select = self.expression.copy()
-        if main_select_ctes:
-            main_select.set("with", exp.With(expressions=main_select_ctes))
+        # The bodies of cached CTEs now belong to their own select expressions
+        if select_expressions:
+            main_select.set(
+                "with", exp.With(expressions=main_select_ctes) if main_select_ctes else None
+            )
         expression_select_pair = (type(self.output_expression_container), main_select)
         select_expressions.append(expression_select_pair)  # type: ignore
         return select_expressions
 
-    def sql(self, dialect="spark", optimize=True, **kwargs) -> t.List[str]:
+    def sql(
+        self,
+        dialect="spark",
+        optimize=True,
+        rules: t.Sequence[t.Callable] = RULES,
+        **kwargs,
+    ) -> t.List[str]:
+        """
+        Returns the SQL statements needed to produce this DataFrame.
+
+        `rules` is the sequence of optimizer rules used when `optimize` is True. Pipelines that
+        don't need the full optimizer, such as ones where `sql()` is called repeatedly while
+        iterating, can pass a subset to skip the more expensive rules.
+        """
         df = self._resolve_pending_hints()
+        # Each select expression is a fresh copy, so the steps below modify it in-place
         select_expressions = df._get_select_expressions()
         output_expressions: t.List[t.Union[exp.Select, exp.Cache, exp.Drop]] = []
         replacement_mapping: t.Dict[exp.Identifier, exp.Identifier] = {}
         for expression_type, select_expression in select_expressions:
-            select_expression = select_expression.transform(replace_id_value, replacement_mapping)
+            if replacement_mapping:
+                select_expression = select_expression.transform(
+                    replace_id_value, replacement_mapping, copy=False
+                )
             if optimize:
-                select_expression = optimize_func(select_expression)
+                select_expression = optimize_func(select_expression, rules=rules)
             select_expression = df._replace_cte_names_with_hashes(select_expression)
             expression: t.Union[exp.Select, exp.Cache, exp.Drop]
             if expression_type == exp.Cache:
@@ -310,11 +408,18 @@ class DataFrame:
                 replacement_mapping[exp.to_identifier(original_alias_name)] = exp.to_identifier(  # type: ignore
                     cache_table_name
                 )
+                # The cache table's schema needs the column types, which only exist if the
+                # optimizer rules that ran qualified the columns and then annotated the types
+                typed_select_expression = select_expression
+                if not optimize or any(rule not in rules for rule in CACHE_SCHEMA_RULES):
+                    typed_select_expression = optimize_func(
+                        select_expression, rules=CACHE_SCHEMA_RULES
+                    )
                 sqlglot.schema.add_table(
                     cache_table_name,
                     {
                         expression.alias_or_name: expression.type.sql("spark")
-                        for expression in select_expression.expressions
+                        for expression in typed_select_expression.expressions
                     },
                 )
                 cache_storage_level = select_expression.args["cache_storage_level"]
@@ -332,11 +437,11 @@ class DataFrame:
                 expression.set("expression", select_expression)
             elif expression_type == exp.Insert:
                 expression = df.output_expression_container.copy()
-                select_without_ctes = select_expression.copy()
-                select_without_ctes.set("with", None)
-                expression.set("expression", select_without_ctes)
-                if select_expression.ctes:
-                    expression.set("with", exp.With(expressions=select_expression.ctes))
+                ctes = select_expression.ctes
+                select_expression.set("with", None)
+                expression.set("expression", select_expression)
+                if ctes:
+                    expression.set("with", exp.With(expressions=ctes))
             elif expression_type == exp.Select:
                 expression = select_expression
             else:
@@ -348,7 +453,25 @@ class DataFrame:
         ]
 
     def copy(self, **kwargs) -> DataFrame:
-        return DataFrame(**object_to_dict(self, **kwargs))
+        """
+        Expressions are only cloned by the operations that modify them, so the new DataFrame shares
+        its expression and session with this one. Only the list of pending hints is copied since
+        hints are added to and removed from it in-place.
+        """
+        df = DataFrame.__new__(DataFrame)
+        df.spark = kwargs.get("spark", self.spark)
+        df.expression = kwargs.get("expression", self.expression)
+        df.branch_id = kwargs.get("branch_id", self.branch_id)
+        df.sequence_id = kwargs.get("sequence_id", self.sequence_id)
+        df.last_op = kwargs.get("last_op", self.last_op)
+        df.pending_hints = kwargs.get("pending_hints", copy(self.pending_hints))
+        df.output_expression_container = kwargs.get(
+            "output_expression_container", self.output_expression_container
+        )
+        df._outer_select_cache = (
+            self._outer_select_cache if df.expression is self.expression else None
+        )
+        return df
 
     @operation(Operation.SELECT)
     def select(self, *cols, **kwargs) -> DataFrame:
@@ -360,13 +483,17 @@ class DataFrame:
                 join_table_identifiers = [
                     x.this for x in get_tables_from_expression_with_join(self.expression)
                 ]
-                cte_names_in_join = [x.this for x in join_table_identifiers]
+                cte_names_in_join = {x.this for x in join_table_identifiers}
+                ctes_in_join = [
+                    (cte, set(cte.this.named_selects))
+                    for cte in self.expression.ctes
+                    if cte.alias_or_name in cte_names_in_join
+                ]
                 for ambiguous_col in ambiguous_cols:
                     ctes_with_column = [
                         cte
-                        for cte in self.expression.ctes
-                        if cte.alias_or_name in cte_names_in_join
-                        and ambiguous_col.alias_or_name in cte.this.named_selects
+                        for cte, cte_column_names in ctes_in_join
+                        if ambiguous_col.alias_or_name in cte_column_names
                     ]
                     # If the select column does not specify a table and there is a join
                     # then we assume they are referring to the left table
@@ -383,10 +510,16 @@ class DataFrame:
     def alias(self, name: str, **kwargs) -> DataFrame:
         new_sequence_id = self.spark._random_sequence_id
         df = self.copy()
-        for join_hint in df.pending_join_hints:
-            for expression in join_hint.expressions:
+        for i, hint in enumerate(df.pending_hints):
+            if not isinstance(hint, exp.JoinHint) or not any(
+                expression.alias_or_name == self.sequence_id for expression in hint.expressions
+            ):
+                continue
+            # The hints are shared with this DataFrame so the matching ones are copied first
+            hint = df.pending_hints[i] = hint.copy()
+            for expression in hint.expressions:
                 if expression.alias_or_name == self.sequence_id:
-                    expression.set("this", Column.ensure_col(new_sequence_id).expression)
+                    expression.set("this", exp.to_identifier(new_sequence_id))
         df.spark._add_alias_to_mapping(name, new_sequence_id)
         return df._convert_leaf_to_cte(sequence_id=new_sequence_id)
 
@@ -423,7 +556,7 @@ class DataFrame:
             join_columns = [
                 Column(x).set_table_name(pre_join_self_latest_cte_name) for x in columns
             ]
-            join_clause = functools.reduce(
+            join_clause = balanced_reduce(
                 lambda x, y: x & y,
                 [
                     col.copy().set_table_name(pre_join_self_latest_cte_name)
@@ -583,7 +716,7 @@ class DataFrame:
     ) -> DataFrame:
         minimum_non_null = thresh or 0  # will be determined later if thresh is null
         new_df = self.copy()
-        all_columns = self._get_outer_select_columns(new_df.expression)
+        all_columns = self._get_outer_select_columns(new_df)
         if subset:
             null_check_columns = self._ensure_and_normalize_cols(subset)
         else:
@@ -600,7 +733,7 @@ class DataFrame:
         if_null_checks = [
             F.when(column.isNull(), F.lit(1)).otherwise(F.lit(0)) for column in null_check_columns
         ]
-        nulls_added_together = functools.reduce(lambda x, y: x + y, if_null_checks)
+        nulls_added_together = balanced_reduce(lambda x, y: x + y, if_null_checks)
         num_nulls = nulls_added_together.alias("num_nulls")
         new_df = new_df.select(num_nulls, append=True)
         filtered_df = new_df.where(F.col("num_nulls") < F.lit(minimum_num_nulls))
@@ -622,13 +755,10 @@ class DataFrame:
         Possibility for improvement: Use `typeof` function to get the type of the column
         and check if it matches the type of the value provided. If not then make it null.
         """
-        from sqlglot.dataframe.sql.functions import lit
-
         values = None
         columns = None
         new_df = self.copy()
-        all_columns = self._get_outer_select_columns(new_df.expression)
-        all_column_mapping = {column.alias_or_name: column for column in all_columns}
+        all_columns = self._get_outer_select_columns(new_df)
         if isinstance(value, dict):
             values = list(value.values())
             columns = self._ensure_and_normalize_cols(list(value))
@@ -636,18 +766,19 @@ class DataFrame:
             columns = self._ensure_and_normalize_cols(subset) if subset else all_columns
         if not values:
             values = [value] * len(columns)
-        value_columns = [lit(value) for value in values]
 
-        null_replacement_mapping = {
-            column.alias_or_name: (
-                F.when(column.isNull(), value).otherwise(column).alias(column.alias_or_name)
-            )
-            for column, value in zip(columns, value_columns)
+        null_replacements = {
+            column.alias_or_name: (column, F.lit(value)) for column, value in zip(columns, values)
         }
-        null_replacement_mapping = {**all_column_mapping, **null_replacement_mapping}
-        null_replacement_columns = [
-            null_replacement_mapping[column.alias_or_name] for column in all_columns
-        ]
+        null_replacement_columns = []
+        for column in all_columns:
+            name = column.alias_or_name
+            if name in null_replacements:
+                null_column, value_column = null_replacements[name]
+                column = (
+                    F.when(null_column.isNull(), value_column).otherwise(null_column).alias(name)
+                )
+            null_replacement_columns.append(column)
         new_df = new_df.select(*null_replacement_columns)
         return new_df
 
@@ -658,12 +789,9 @@ class DataFrame:
         value: t.Optional[t.Union[bool, int, float, str, t.List]] = None,
         subset: t.Optional[t.Collection[ColumnOrName] | ColumnOrName] = None,
     ) -> DataFrame:
-        from sqlglot.dataframe.sql.functions import lit
-
         old_values = None
         new_df = self.copy()
-        all_columns = self._get_outer_select_columns(new_df.expression)
-        all_column_mapping = {column.alias_or_name: column for column in all_columns}
+        all_columns = self._get_outer_select_columns(new_df)
 
         columns = self._ensure_and_normalize_cols(subset) if subset else all_columns
         if isinstance(to_replace, dict):
@@ -677,38 +805,35 @@ class DataFrame:
             old_values = to_replace
             new_values = value
         else:
-            old_values = [to_replace] * len(columns)
-            new_values = [value] * len(columns)
-        old_values = [lit(value) for value in old_values]
-        new_values = [lit(value) for value in new_values]
-
-        replacement_mapping = {}
-        for column in columns:
-            expression = Column(None)
-            for i, (old_value, new_value) in enumerate(zip(old_values, new_values)):
-                if i == 0:
-                    expression = F.when(column == old_value, new_value)
-                else:
-                    expression = expression.when(column == old_value, new_value)  # type: ignore
-            replacement_mapping[column.alias_or_name] = expression.otherwise(column).alias(
-                column.expression.alias_or_name
-            )
-
-        replacement_mapping = {**all_column_mapping, **replacement_mapping}
-        replacement_columns = [replacement_mapping[column.alias_or_name] for column in all_columns]
+            old_values = [to_replace]
+            new_values = [value]
+        old_values = [F.lit(value) for value in old_values]
+        new_values = [F.lit(value) for value in new_values]
+
+        replacements = {column.alias_or_name: column for column in columns}
+        replacement_columns = []
+        for column in all_columns:
+            name = column.alias_or_name
+            if name in replacements and old_values:
+                replace_column = replacements[name]
+                case = F.when(replace_column == old_values[0], new_values[0])
+                for old_value, new_value in zip(old_values[1:], new_values[1:]):
+                    case = case.when(replace_column == old_value, new_value)
+                column = case.otherwise(replace_column).alias(name)
+            replacement_columns.append(column)
         new_df = new_df.select(*replacement_columns)
         return new_df
 
     @operation(Operation.SELECT)
     def withColumn(self, colName: str, col: Column) -> DataFrame:
         col = self._ensure_and_normalize_col(col)
-        existing_col_names = self.expression.named_selects
-        existing_col_index = (
-            existing_col_names.index(colName) if colName in existing_col_names else None
-        )
-        if existing_col_index:
+        existing_col_indexes: t.Dict[str, int] = {}
+        for i, expression in enumerate(self.expression.expressions):
+            existing_col_indexes.setdefault(expression.alias_or_name, i)
+        existing_col_index = existing_col_indexes.get(colName)
+        if existing_col_index is not None:
             expression = self.expression.copy()
-            expression.expressions[existing_col_index] = col.expression
+            expression.expressions[existing_col_index].replace(col.alias(colName).expression)
             return self.copy(expression=expression)
         return self.copy().select(col.alias(colName), append=True)
 
@@ -731,13 +856,10 @@ class DataFrame:
 
     @operation(Operation.SELECT)
     def drop(self, *cols: t.Union[str, Column]) -> DataFrame:
-        all_columns = self._get_outer_select_columns(self.expression)
+        all_columns = self._get_outer_select_columns(self)
         drop_cols = self._ensure_and_normalize_cols(cols)
-        new_columns = [
-            col
-            for col in all_columns
-            if col.alias_or_name not in [drop_column.alias_or_name for drop_column in drop_cols]
-        ]
+        drop_col_names = {drop_column.alias_or_name for drop_column in drop_cols}
+        new_columns = [col for col in all_columns if col.alias_or_name not in drop_col_names]
         return self.copy().select(*new_columns, append=False)
 
     @operation(Operation.LIMIT)
@@ -750,7 +872,7 @@ class DataFrame:
         parameter_columns = (
             self._ensure_list_of_columns(parameter_list)
             if parameters
-            else Column.ensure_cols([self.sequence_id])
+            else [Column(exp.column(self.sequence_id))]
         )
         return self._hint(name, parameter_columns)
 
@@ -781,6 +903,8 @@ class DataFrame:
 
 
 class DataFrameNaFunctions:
+    __slots__ = ("df",)
+
     def __init__(self, df: DataFrame):
         self.df = df
 
@@ -16,11 +16,14 @@ if t.TYPE_CHECKING:
 def normalize(spark: SparkSession, expression_context: exp.Select, expr: t.List[NORMALIZE_INPUT]):
     expr = ensure_list(expr)
     expressions = _ensure_expressions(expr)
+    ctes_in_join = _get_ctes_in_join(expression_context)
     for expression in expressions:
         identifiers = expression.find_all(exp.Identifier)
         for identifier in identifiers:
             replace_alias_name_with_cte_name(spark, expression_context, identifier)
-            replace_branch_and_sequence_ids_with_cte_name(spark, expression_context, identifier)
+            replace_branch_and_sequence_ids_with_cte_name(
+                spark, expression_context, identifier, ctes_in_join
+            )
 
 
 def replace_alias_name_with_cte_name(
@@ -34,7 +37,10 @@ def replace_alias_name_with_cte_name(
 
 
 def replace_branch_and_sequence_ids_with_cte_name(
-    spark: SparkSession, expression_context: exp.Select, id: exp.Identifier
+    spark: SparkSession,
+    expression_context: exp.Select,
+    id: exp.Identifier,
+    ctes_in_join: t.Optional[t.List[exp.CTE]] = None,
 ):
     if id.alias_or_name in spark.known_ids:
         # Check if we have a join and if both the tables in that join share a common branch id
@@ -42,12 +48,8 @@ def replace_branch_and_sequence_ids_with_cte_name(
         # id then it keeps that reference. This handles the weird edge case in spark that shouldn't
         # be common in practice
         if expression_context.args.get("joins") and id.alias_or_name in spark.known_branch_ids:
-            join_table_aliases = [
-                x.alias_or_name for x in get_tables_from_expression_with_join(expression_context)
-            ]
-            ctes_in_join = [
-                cte for cte in expression_context.ctes if cte.alias_or_name in join_table_aliases
-            ]
+            if ctes_in_join is None:
+                ctes_in_join = _get_ctes_in_join(expression_context)
             if ctes_in_join[0].args["branch_id"] == ctes_in_join[1].args["branch_id"]:
                 assert len(ctes_in_join) == 2
                 _set_alias_name(id, ctes_in_join[0].alias_or_name)
@@ -59,6 +61,15 @@ def replace_branch_and_sequence_ids_with_cte_name(
                 return
 
 
+def _get_ctes_in_join(expression_context: exp.Select) -> t.List[exp.CTE]:
+    join_table_aliases = {
+        x.alias_or_name for x in get_tables_from_expression_with_join(expression_context)
+    }
+    if not join_table_aliases:
+        return []
+    return [cte for cte in expression_context.ctes if cte.alias_or_name in join_table_aliases]
+
+
 def _set_alias_name(id: exp.Identifier, name: str):
     id.set("this", name)
 
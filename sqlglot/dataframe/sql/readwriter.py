@@ -4,7 +4,6 @@ import typing as t
 
 import sqlglot
 from sqlglot import expressions as exp
-from sqlglot.helper import object_to_dict
 
 if t.TYPE_CHECKING:
     from sqlglot.dataframe.sql.dataframe import DataFrame
@@ -39,10 +38,17 @@ class DataFrameWriter:
         self._by_name = by_name
 
     def copy(self, **kwargs) -> DataFrameWriter:
+        """
+        The DataFrame and session are shared with the new writer. Copying the session would give
+        the writer its own id counters, which would then go out of sync with the original session.
+        """
         return DataFrameWriter(
             **{
-                k[1:] if k.startswith("_") else k: v
-                for k, v in object_to_dict(self, **kwargs).items()
+                "df": self._df,
+                "spark": self._spark,
+                "mode": self._mode,
+                "by_name": self._by_name,
+                **{k[1:] if k.startswith("_") else k: v for k, v in kwargs.items()},
             }
         )
 
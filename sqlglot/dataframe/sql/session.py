@@ -1,7 +1,7 @@
 from __future__ import annotations
 
+import os
 import typing as t
-import uuid
 from collections import defaultdict
 
 import sqlglot
@@ -21,6 +21,8 @@ class SparkSession:
     known_branch_ids: t.ClassVar[t.Set[str]] = set()
     known_sequence_ids: t.ClassVar[t.Set[str]] = set()
     name_to_sequence_id_mapping: t.ClassVar[t.Dict[str, t.List[str]]] = defaultdict(list)
+    random_name_pool: t.ClassVar[t.List[str]] = []
+    random_name_batch_size: t.ClassVar[int] = 256
 
     def __init__(self):
         self.incrementing_id = 1
@@ -129,7 +131,11 @@ class SparkSession:
 
     @property
     def _random_name(self) -> str:
-        return "r" + uuid.uuid4().hex
+        pool = self.random_name_pool
+        if not pool:
+            random_hex = os.urandom(16 * self.random_name_batch_size).hex()
+            pool.extend("r" + random_hex[i : i + 32] for i in range(0, len(random_hex), 32))
+        return pool.pop()
 
     @property
     def _random_branch_id(self) -> str:
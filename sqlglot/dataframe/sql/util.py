@@ -8,6 +8,8 @@ from sqlglot.dataframe.sql import types
 if t.TYPE_CHECKING:
     from sqlglot.dataframe.sql._typing import SchemaInput
 
+T = t.TypeVar("T")
+
 
 def get_column_mapping_from_schema_input(schema: SchemaInput) -> t.Dict[str, t.Optional[str]]:
     if isinstance(schema, dict):
@@ -30,3 +32,15 @@ def get_tables_from_expression_with_join(expression: exp.Select) -> t.List[exp.T
     left_table = expression.args["from"].args["expressions"][0]
     other_tables = [join.this for join in expression.args["joins"]]
     return [left_table] + other_tables
+
+
+def balanced_reduce(func: t.Callable[[T, T], T], items: t.Sequence[T]) -> T:
+    """
+    Works like `functools.reduce` but combines the items pairwise so that the resulting expression
+    tree has a depth of log(n) instead of n. Only use this for associative operations.
+    """
+    items = list(items)
+    while len(items) > 1:
+        paired = [func(left, right) for left, right in zip(items[::2], items[1::2])]
+        items = paired + items[-1:] if len(items) % 2 else paired
+    return items[0]
@@ -1,5 +1,12 @@
+from unittest import mock
+
+import sqlglot
 from sqlglot import expressions as exp
+from sqlglot.dataframe.sql import functions as F
 from sqlglot.dataframe.sql.dataframe import DataFrame
+from sqlglot.optimizer.qualify_columns import qualify_columns
+from sqlglot.optimizer.qualify_tables import qualify_tables
+from sqlglot.schema import MappingSchema
 from tests.dataframe.unit.dataframe_sql_validator import DataFrameSQLValidator
 
 
@@ -10,11 +17,108 @@ class TestDataframe(DataFrameSQLValidator):
         expression = exp.select("cola").from_("table")
         self.assertEqual("t17051", DataFrame._create_hash_from_expression(expression))
 
+    def test_sql_does_not_modify_expression(self):
+        df = self.df_employee.select("fname").cache().select("fname")
+        expected = df.expression.copy()
+        df.sql()
+        self.assertEqual(expected, df.expression)
+        df = self.df_employee.select("fname").where(F.col("fname") == "Jack").select("fname")
+        expected = df.expression.copy()
+        df.sql(optimize=False)
+        self.assertEqual(expected, df.expression)
+
+    def test_sql_rules(self):
+        df = self.df_employee.where(F.col("age") > 30).select("fname")
+        self.assertEqual(df.sql(optimize=False), df.sql(rules=[]))
+        self.assertNotEqual(df.sql(), df.sql(rules=[]))
+
+    @mock.patch("sqlglot.schema", MappingSchema())
+    def test_sql_rules_cache(self):
+        df = self.df_employee.select("fname", (F.col("age") + 1).alias("age_plus")).cache()
+        df = df.select("fname")
+        for kwargs in ({"rules": [qualify_tables, qualify_columns]}, {"optimize": False}):
+            statements = df.sql(**kwargs)
+            self.assertEqual(3, len(statements))
+            cache_table_name = statements[0].split()[-1]
+            self.assertEqual(
+                {"fname": "STRING", "age_plus": "INT"},
+                sqlglot.schema.mapping[cache_table_name],
+            )
+
+    def test_builders_keep_parents(self):
+        df = self.df_employee.select("fname", "age")
+        df.select("fname")
+        df.hint("broadcast").select("fname")
+        for node, parent, _ in df.expression.walk():
+            self.assertIs(parent, node.parent)
+        self.assertEqual([], df.expression.args.get("hint", exp.Hint()).expressions)
+        df = df.repartition(5)
+        self.assertEqual(df.sql(), df.sql())
+
+    def test_resolve_pending_hints_without_join(self):
+        df = self.df_employee.hint("broadcast")
+        self.assertIs(df.expression, df._resolve_pending_hints().expression)
+        df = df.repartition(5)
+        self.assertIsNot(df.expression, df._resolve_pending_hints().expression)
+
+    def test_convert_leaf_to_cte_copies_ctes_once(self):
+        df = self.df_employee.select("fname", "age").select("fname")
+        self.assertEqual(2, len(df.expression.ctes))
+        with mock.patch.object(
+            exp.Expression, "__deepcopy__", autospec=True, side_effect=exp.Expression.__deepcopy__
+        ) as deepcopy:
+            df._convert_leaf_to_cte()
+        copied = [call.args[0] for call in deepcopy.call_args_list]
+        self.assertEqual(2, sum(isinstance(node, exp.CTE) for node in copied))
+
     def test_columns(self):
         self.assertEqual(
             ["employee_id", "fname", "lname", "age", "store_id"], self.df_employee.columns
         )
 
+    def test_outer_select_columns_cache(self):
+        df = self.df_employee.select("fname", "lname")
+        columns = df._get_outer_select_columns(df)
+        self.assertEqual(["fname", "lname"], [column.alias_or_name for column in columns])
+        self.assertIs(columns[0].expression, df._get_outer_select_columns(df)[0].expression)
+        df_copy = df.copy()
+        self.assertIs(
+            columns[0].expression, df_copy._get_outer_select_columns(df_copy)[0].expression
+        )
+        df.expression = df.expression.select("age")
+        self.assertEqual(
+            ["fname", "lname", "age"],
+            [column.alias_or_name for column in df._get_outer_select_columns(df)],
+        )
+
+    def test_with_column_existing_first_column(self):
+        df = self.df_employee.withColumn("employee_id", F.col("age"))
+        self.assertEqual(["employee_id", "fname", "lname", "age", "store_id"], df.columns)
+        for node, parent, _ in df.expression.walk():
+            self.assertIs(parent, node.parent)
+        self.compare_sql(
+            df,
+            "SELECT `a1`.`age` AS `employee_id`, CAST(`a1`.`fname` AS STRING) AS `fname`, CAST(`a1`.`lname` AS STRING) AS `lname`, `a1`.`age` AS `age`, `a1`.`store_id` AS `store_id` FROM VALUES (1, 'Jack', 'Shephard', 37, 1), (2, 'John', 'Locke', 65, 1), (3, 'Kate', 'Austen', 37, 2), (4, 'Claire', 'Littleton', 27, 2), (5, 'Hugo', 'Reyes', 29, 100) AS `a1`(`employee_id`, `fname`, `lname`, `age`, `store_id`)",
+        )
+
+    def test_replace_single_value(self):
+        df = self.df_employee.select("age", "store_id").replace(37, 100)
+        self.compare_sql(
+            df,
+            "SELECT CASE WHEN `a1`.`age` = 37 THEN 100 ELSE `a1`.`age` END AS `age`, CASE WHEN `a1`.`store_id` = 37 THEN 100 ELSE `a1`.`store_id` END AS `store_id` FROM VALUES (1, 'Jack', 'Shephard', 37, 1), (2, 'John', 'Locke', 65, 1), (3, 'Kate', 'Austen', 37, 2), (4, 'Claire', 'Littleton', 27, 2), (5, 'Hugo', 'Reyes', 29, 100) AS `a1`(`employee_id`, `fname`, `lname`, `age`, `store_id`)",
+        )
+
+    def test_hint_alias(self):
+        df_store = self.spark.createDataFrame([(1, "Hydra")], ["store_id", "store_name"])
+        df_store_hint = df_store.hint("broadcast")
+        parent_sql = self.df_employee.join(df_store_hint, on="store_id").sql()
+        df = self.df_employee.join(df_store_hint.alias("s"), on="store_id")
+        self.assertEqual(parent_sql, self.df_employee.join(df_store_hint, on="store_id").sql())
+        self.compare_sql(
+            df,
+            "SELECT /*+ BROADCAST(`a2`) */ `a1`.`store_id` AS `store_id`, `a1`.`employee_id` AS `employee_id`, CAST(`a1`.`fname` AS STRING) AS `fname`, CAST(`a1`.`lname` AS STRING) AS `lname`, `a1`.`age` AS `age`, `a2`.`store_name` AS `store_name` FROM VALUES (1, 'Jack', 'Shephard', 37, 1), (2, 'John', 'Locke', 65, 1), (3, 'Kate', 'Austen', 37, 2), (4, 'Claire', 'Littleton', 27, 2), (5, 'Hugo', 'Reyes', 29, 100) AS `a1`(`employee_id`, `fname`, `lname`, `age`, `store_id`) JOIN VALUES (1, 'Hydra') AS `a2`(`store_id`, `store_name`) ON `a1`.`store_id` = `a2`.`store_id`",
+        )
+
     def test_cache(self):
         df = self.df_employee.select("fname").cache()
         expected_statements = [
@@ -8,6 +8,13 @@ from tests.dataframe.unit.dataframe_sql_validator import DataFrameSQLValidator
 class TestDataFrameWriter(DataFrameSQLValidator):
     maxDiff = None
 
+    def test_copy_shares_session(self):
+        writer = self.df_employee.write.mode("overwrite").byName
+        self.assertIs(self.spark, writer._spark)
+        self.assertIs(self.spark, writer._df.spark)
+        self.assertIs(self.spark, self.df_employee.copy().spark)
+        self.assertEqual(("overwrite", True), (writer._mode, writer._by_name))
+
     def test_insertInto_full_path(self):
         df = self.df_employee.write.insertInto("catalog.db.table_name")
         expected = "INSERT INTO catalog.db.table_name SELECT `a1`.`employee_id` AS `employee_id`, CAST(`a1`.`fname` AS STRING) AS `fname`, CAST(`a1`.`lname` AS STRING) AS `lname`, `a1`.`age` AS `age`, `a1`.`store_id` AS `store_id` FROM VALUES (1, 'Jack', 'Shephard', 37, 1), (2, 'John', 'Locke', 65, 1), (3, 'Kate', 'Austen', 37, 2), (4, 'Claire', 'Littleton', 27, 2), (5, 'Hugo', 'Reyes', 29, 100) AS `a1`(`employee_id`, `fname`, `lname`, `age`, `store_id`)"
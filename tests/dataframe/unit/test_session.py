@@ -118,3 +118,10 @@ class TestDataframeSession(DataFrameSQLValidator):
     def test_session_create_builder_patterns(self):
         spark = SparkSession()
         self.assertEqual(spark.builder.appName("abc").getOrCreate(), spark)
+
+    def test_random_ids_unique(self):
+        spark = SparkSession()
+        ids = [spark._random_id for _ in range(SparkSession.random_name_batch_size * 2 + 1)]
+        self.assertEqual(len(set(ids)), len(ids))
+        self.assertTrue(all(len(id) == 33 and id.startswith("r") for id in ids))
+        self.assertTrue(set(ids) <= SparkSession.known_ids)